@@ -1,6 +1,16 @@
 """CalgaryToSpace CTS-SAT-1 Ground Support Software."""
 
-from cts1_ground_support.terminal_app.dash_gui import main
+
+def main() -> None:
+    """Run the terminal app.
+
+    The GUI is imported on call, so that importing a lightweight module from this package (e.g.,
+    `cts1_ground_support.json_parser`) doesn't import Dash.
+    """
+    from cts1_ground_support.terminal_app.cli import main as cli_main  # noqa: PLC0415
+
+    cli_main()
+
 
 if __name__ == "__main__":
     main()
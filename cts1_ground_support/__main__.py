@@ -1,6 +1,6 @@
 """Main entry point for running the package like `python -m cts1_ground_support`."""
 
-from cts1_ground_support.terminal_app.dash_gui import main
+from cts1_ground_support.terminal_app.cli import main
 
 if __name__ == "__main__":
     main()
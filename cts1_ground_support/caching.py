@@ -0,0 +1,60 @@
+"""Caching utilities, for values which should be refreshed now and then."""
+
+import functools
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Generic, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class TtlCachedFunction(Generic[P, R]):
+    """A function wrapper which caches results for a fixed time. Made by `ttl_cache`.
+
+    Expired entries are only replaced when their args are called again; they are never evicted.
+    Only use it for functions called with a small, bounded set of args.
+    """
+
+    def __init__(self, func: Callable[P, R], ttl_sec: float) -> None:
+        """Wrap `func`, caching each result for `ttl_sec` seconds."""
+        self._func = func
+        self._ttl_sec = ttl_sec
+        self._cache: dict[Hashable, tuple[float, R]] = {}
+        self._lock = threading.Lock()
+        functools.update_wrapper(self, func)
+
+    def __call__(self: "TtlCachedFunction[P, R]", *args: P.args, **kwargs: P.kwargs) -> R:
+        """Get the cached result for the args, or call the function if it's missing/expired."""
+        key = (args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+
+        with self._lock:
+            cached = self._cache.get(key)
+        if (cached is not None) and (now - cached[0] < self._ttl_sec):
+            return cached[1]
+
+        # Call outside the lock, so that a slow call doesn't block other args' cache hits.
+        result = self._func(*args, **kwargs)
+        with self._lock:
+            self._cache[key] = (now, result)
+        return result
+
+    def cache_clear(self: "TtlCachedFunction[P, R]") -> None:
+        """Clear the cache, like `functools.lru_cache`'s `cache_clear`."""
+        with self._lock:
+            self._cache.clear()
+
+
+def ttl_cache(ttl_sec: float) -> Callable[[Callable[P, R]], TtlCachedFunction[P, R]]:
+    """Cache a function's results (by its args) for `ttl_sec` seconds.
+
+    Like `functools.lru_cache`, but entries are recomputed once they're older than `ttl_sec`.
+    The args must be hashable.
+    """
+
+    def decorator(func: Callable[P, R]) -> TtlCachedFunction[P, R]:
+        return TtlCachedFunction(func, ttl_sec)
+
+    return decorator
@@ -1,12 +1,19 @@
 """Tools for parsing JSON strings from blobs of text."""
 
+import re
 from collections.abc import Iterator
 from dataclasses import dataclass
 
 import orjson
 
+# Characters which affect the nesting depth while scanning for the end of a JSON object.
+_JSON_STRUCTURAL_CHAR_RE = re.compile(r'[{}\[\]"\\]')
 
-@dataclass(kw_only=True)
+# A JSON object must start with a key or be empty, so skip any other `{` (e.g., `{foo}` in code).
+_JSON_OBJECT_START_RE = re.compile(r'{\s*["}]')
+
+
+@dataclass(kw_only=True, slots=True)
 class ParsedJson:
     """A parsed JSON object."""
 
@@ -16,37 +23,98 @@ class ParsedJson:
     original_str: str
 
 
+def _find_json_object_ends(content: str, start_idx: int) -> dict[int, int | None]:
+    """Find the end of the object opened at `start_idx`, and of each object nested inside it.
+
+    Tracks the brace/bracket nesting with a stack, while honouring string literals and backslash
+    escapes. Scanning stops once the object at `start_idx` is closed.
+
+    Returns a dict from the index of each `{` opened during the scan (outside of a string) to the
+    index just past its closing brace, or to None if it's never closed. A scan starting at any of
+    those nested `{` would give the same result, so they never need to be scanned again.
+    """
+    ends: dict[int, int | None] = {}
+    # Index of each open `{`, or -1 for an open `[`.
+    stack: list[int] = []
+    in_string = False
+    escaped_idx = -1  # Index of the character following a backslash in a string.
+
+    # Let the regex engine skip over the runs of uninteresting characters.
+    for match in _JSON_STRUCTURAL_CHAR_RE.finditer(content, start_idx):
+        idx = match.start()
+        char = match.group()
+
+        if in_string:
+            # Characters following a backslash are skipped.
+            if char == "\\" and idx != escaped_idx:
+                escaped_idx = idx + 1
+            elif char == '"' and idx != escaped_idx:
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append(idx if char == "{" else -1)
+        elif char in "}]":
+            open_idx = stack.pop()
+            if open_idx >= 0:
+                ends[open_idx] = idx + 1
+            if not stack:
+                return ends
+
+    # Anything still open is never closed.
+    ends.update(dict.fromkeys(open_idx for open_idx in stack if open_idx >= 0))
+    return ends
+
+
 def extract_json_blobs(content: str) -> Iterator[ParsedJson]:
-    """Extract JSON values from a string."""
-    # Source: https://stackoverflow.com/a/64920157
-    start_idx = 0
-    while start_idx < len(content):
-        if content[start_idx] == "{":
-            for end_idx in range(len(content) - 1, start_idx, -1):
-                if content[end_idx] == "}":
-                    try:
-                        data = orjson.loads(content[start_idx : end_idx + 1])
-                        yield ParsedJson(
-                            data=data,
-                            start_idx=start_idx,
-                            end_idx=end_idx + 1,
-                            original_str=content[start_idx : end_idx + 1],
-                        )
-                        start_idx = end_idx
-                        break
-                    except orjson.JSONDecodeError:
-                        pass
-        start_idx += 1
+    """Extract JSON objects from a string.
+
+    Does a forward pass, finding each balanced top-level `{...}` span. Only those spans are
+    passed to the JSON decoder. The ends found while scanning a span are reused for the objects
+    nested inside it, so an unterminated span isn't re-scanned from each of its inner braces.
+    """
+    known_ends: dict[int, int | None] = {}
+
+    start_idx = content.find("{")
+    while start_idx != -1:
+        if not _JSON_OBJECT_START_RE.match(content, start_idx):
+            start_idx = content.find("{", start_idx + 1)
+            continue
+
+        if start_idx not in known_ends:
+            known_ends.update(_find_json_object_ends(content, start_idx))
+        end_idx = known_ends[start_idx]
+
+        if end_idx is not None:
+            try:
+                data = orjson.loads(content[start_idx:end_idx])
+            except orjson.JSONDecodeError:
+                pass
+            else:
+                yield ParsedJson(
+                    data=data,
+                    start_idx=start_idx,
+                    end_idx=end_idx,
+                    original_str=content[start_idx:end_idx],
+                )
+                start_idx = content.find("{", end_idx)
+                continue
+
+        # Not valid JSON (or never closed). Move on to just after the opening brace, in case a
+        # valid object is nested inside this span.
+        start_idx = content.find("{", start_idx + 1)
 
 
 def auto_format_json_in_blob(blob: str) -> str:
     """Automatically format JSON in a blob of text."""
-    json_parts = list(extract_json_blobs(blob))
-
-    for json_part in json_parts:
-        formatted_data: str = orjson.dumps(json_part.data, option=orjson.OPT_INDENT_2).decode(
-            "utf-8"
-        )
-        blob = blob.replace(json_part.original_str, formatted_data)
+    # Splice the formatted JSON in left-to-right using the recorded indices, rather than
+    # searching and replacing within the whole blob for each JSON part.
+    out_parts: list[str] = []
+    cursor = 0
+    for json_part in extract_json_blobs(blob):  # Yielded in order of `start_idx`.
+        out_parts.append(blob[cursor : json_part.start_idx])
+        out_parts.append(orjson.dumps(json_part.data, option=orjson.OPT_INDENT_2).decode("utf-8"))
+        cursor = json_part.end_idx
+    out_parts.append(blob[cursor:])
 
-    return blob
+    return "".join(out_parts)
@@ -1,28 +1,65 @@
 """Utility functions for working with paths in the repository."""
 
+import functools
+import subprocess
 from pathlib import Path
 
-import git
 
-
-def clone_firmware_repo(repo_parent_path: Path) -> tuple[Path, git.Repo]:
-    """Clone the CTS-SAT-1-OBC-Firmware repository."""
-    repo = git.Repo.clone_from(
-        "https://github.com/CalgaryToSpace/CTS-SAT-1-OBC-Firmware.git",
-        to_path=repo_parent_path / "CTS-SAT-1-OBC-Firmware",
-        branch="main",
-        depth=1,  # Only clone the latest version of the main branch.
-    )
+def clone_firmware_repo(repo_parent_path: Path) -> Path:
+    """Clone the CTS-SAT-1-OBC-Firmware repository, and return the path to it."""
     firmware_repo_path = Path(repo_parent_path) / "CTS-SAT-1-OBC-Firmware"
+    subprocess.run(  # noqa: S603
+        [  # noqa: S607
+            "git",
+            "clone",
+            "--depth=1",  # Only clone the latest version of the main branch.
+            "--branch=main",
+            "https://github.com/CalgaryToSpace/CTS-SAT-1-OBC-Firmware.git",
+            str(firmware_repo_path),
+        ],
+        check=True,
+    )
 
     if not firmware_repo_path.is_dir():
         msg = "Failed to clone CTS-SAT-1-OBC-Firmware repo."
         raise FileNotFoundError(msg)
 
-    return (firmware_repo_path, repo)
+    return firmware_repo_path
+
+
+def get_repo_commit_hash(repo_path: Path) -> str:
+    """Get the short hash of the commit checked out in a git repository."""
+    result = subprocess.run(
+        ["git", "rev-parse", "--short=7", "HEAD"],  # noqa: S607
+        cwd=repo_path,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return result.stdout.strip()
+
+
+@functools.lru_cache(maxsize=256)
+def _read_binary_file_cached(file_path: Path, _mtime_ns: int, _size: int) -> bytes:
+    """Read a file's raw bytes. Cached by path and modification time/size."""
+    return file_path.read_bytes()
+
+
+def read_binary_file(file_path: Path | str) -> bytes:
+    """Read a file's raw bytes, without decoding.
+
+    Unchanged files are served from a cache, so re-parsing the repo doesn't re-read every file.
+    """
+    file_path = Path(file_path).resolve()
+    stat = file_path.stat()
+    return _read_binary_file_cached(file_path, stat.st_mtime_ns, stat.st_size)
 
 
 def read_text_file(file_path: Path | str) -> str:
-    """Read text file as UTF-8 in a cross-platform way."""
-    # Note: following encoding arg is very important.
-    return Path(file_path).read_text(encoding="utf-8")
+    """Read text file as UTF-8 in a cross-platform way.
+
+    Decodes the (cached) output of `read_binary_file`, so that each file is only cached once.
+    """
+    # Note: following encoding is very important. Newlines are normalized like in text mode.
+    text = read_binary_file(file_path).decode("utf-8")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
@@ -1,20 +1,117 @@
 """A set of tools to read the list of telecommands from the `telecommand_definitions.c` file."""
 
-import json
+import functools
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from cts1_ground_support.paths import read_text_file
+import orjson
+
+from cts1_ground_support.paths import read_binary_file, read_text_file
 from cts1_ground_support.telecommand_types import TelecommandDefinition
 
+# Matches both `/* */` (as the `block` group) and `//` comments, so they're removed in one pass.
+# The shared `\s*/` prefix is factored out, so that each `/` is only tried once (faster than the
+# plain alternation, and than two separate passes). DOTALL makes . match newlines.
+_C_COMMENT_RE = re.compile(r"\s*/(?:(?P<block>\*.*?\*/\s*)|/[^\n]*)", flags=re.DOTALL)
+
+# Matches the start of the telecommand array, up to and including its opening brace.
+_TOP_LEVEL_RE = re.compile(r"TCMD_TelecommandDefinition_t\s+\w+\s*\[\s*\]\s*=\s*{")
+
+# The characters which matter while walking through the telecommand array's struct initializers.
+_STRUCT_ARRAY_TOKEN_RE = re.compile(r'[{}",]')
+_STRUCT_ARRAY_GAP_RE = re.compile(r"[\s,]*")
+_STRUCT_ARRAY_END_RE = re.compile(r"\s*;")
+
+_ARG_DESC_RE = re.compile(r"[\s/]*- Arg (?P<arg_num>\d+): (?P<arg_description>.+)\s*")
+
+_DOCSTRING_RE_FMT = r"(?P<docstring>(///(.*)\s*)+)\s*(?P<return_type>\w+)\s+{function_name}\s*\("
+
+# Matches the docstring of every function, for building an index in a single pass.
+_DOC_INDEX_RE = re.compile(
+    r"(?P<docstring>(?:///.*\s*)+)\s*(?P<return_type>\w+)\s+(?P<function_name>\w+)\s*\("
+)
+_DOC_INDEX_BYTES_RE = re.compile(_DOC_INDEX_RE.pattern.encode("ascii"))
+
+
+@functools.cache
+def _get_docstring_regex(function_name: str) -> re.Pattern[str]:
+    """Get the compiled regex which matches the docstring of the specified function."""
+    return re.compile(_DOCSTRING_RE_FMT.format(function_name=function_name))
+
+
+def _as_str(value: str | bytes) -> str:
+    """Decode `value` as UTF-8 if it's `bytes`, otherwise return it as-is."""
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    return value
+
+
+def _clean_docstring(docstring: str) -> str:
+    """Remove the `///` characters and surrounding whitespace from each line of a docstring."""
+    docstring_lines = [line.strip().lstrip("/").strip() for line in docstring.strip().split("\n")]
+    return "\n".join(docstring_lines)
+
+
+def _add_struct_field(fields: dict[str, str], field_declaration: str) -> None:
+    """Parse a `.field_name = field_value` declaration from a struct initializer into `fields`."""
+    field_name, sep, field_value = field_declaration.partition("=")
+    if sep:
+        fields[field_name.strip().lstrip(".")] = field_value.strip().strip('"')
+
+
+def _parse_struct_array_body(c_code: str, start_idx: int) -> list[dict[str, str]] | None:
+    """Parse the structs in an array initializer like `{ {.a = 1}, {.a = 2} };`.
+
+    Walks through the array once, starting just after its opening brace. The regex engine skips
+    over everything except braces, commas, and quotes, which drive a small state machine.
+
+    Returns the fields of each struct, or None if the array is malformed (e.g., empty,
+    unterminated, or with anything other than struct initializers in it).
+    """
+    structs: list[dict[str, str]] = []
+    fields: dict[str, str] | None = None  # The fields of the current struct, while inside one.
+    in_string = False
+    segment_start_idx = start_idx  # Start of the current field, or of the gap between structs.
+
+    for match in _STRUCT_ARRAY_TOKEN_RE.finditer(c_code, start_idx):
+        char = match.group()
+        idx = match.start()
+
+        if in_string:
+            in_string = char != '"'
+        elif fields is not None:
+            # Inside a struct initializer.
+            if char == '"':
+                in_string = True
+            elif char == "{":
+                return None  # Nested initializers aren't supported.
+            else:
+                _add_struct_field(fields, c_code[segment_start_idx:idx])
+                segment_start_idx = idx + 1
+                if char == "}":
+                    structs.append(fields)
+                    fields = None
+        elif not _STRUCT_ARRAY_GAP_RE.fullmatch(c_code, segment_start_idx, idx):
+            return None  # Only whitespace and commas are allowed between the structs.
+        elif char == "{":
+            fields = {}
+            segment_start_idx = idx + 1
+        elif char == "}":
+            # End of the array, which must hold at least one struct.
+            return structs if (structs and _STRUCT_ARRAY_END_RE.match(c_code, idx + 1)) else None
+        # A comma between the structs is part of the gap.
+
+    return None
+
 
 def remove_c_comments(text: str) -> str:
     """Remove C-style comments from a string.
 
     Note: This function is not perfect, and fails with certain cases.
     """
-    text = re.sub(r"\s*/\*.*?\*/\s*", "\n", text, flags=re.DOTALL)  # DOTALL makes . match newlines
-    return re.sub(r"\s*//.*", "", text)
+    # Block comments are replaced with a newline, and line comments are removed.
+    return _C_COMMENT_RE.sub(lambda match: "\n" if match.group("block") else "", text)
 
 
 def parse_telecommand_array_table(c_code: str | Path) -> list[TelecommandDefinition]:
@@ -50,22 +147,7 @@ def parse_telecommand_array_table(c_code: str | Path) -> list[TelecommandDefinit
 
     c_code = remove_c_comments(c_code)
 
-    top_level_regex = re.compile(
-        r"TCMD_TelecommandDefinition_t\s+\w+\s*\[\s*\]\s*=\s*{"
-        r"(?P<all_struct_declarations>(\s*{\s*[^{}]+\s*},?)+)"
-        r"\s*};",
-    )
-
-    # Use the `struct_body_regex` to extract the body of a struct declaration.
-    struct_body_regex = re.compile(r"{\s*(?P<struct_body>[^{}]+)\s*}")
-
-    # Use the `struct_level_regex` on a "struct_declaration" from the `top_level_regex` to extract
-    # the individual struct fields.
-    struct_level_regex = re.compile(r"\s*\.(?P<field_name>\w+)\s*=\s*(?P<field_value>[^,]+),?")
-
-    telecommands: list[TelecommandDefinition] = []
-
-    top_level_matches = list(top_level_regex.finditer(c_code))
+    top_level_matches = list(_TOP_LEVEL_RE.finditer(c_code))
     if len(top_level_matches) != 1:
         msg = (
             f"Expected to find exactly 1 telecommand array in the input code, but found "
@@ -73,29 +155,23 @@ def parse_telecommand_array_table(c_code: str | Path) -> list[TelecommandDefinit
         )
         raise ValueError(msg)
 
-    top_level_match = top_level_matches[0]
-    all_struct_declarations = top_level_match.group("all_struct_declarations")
-
-    for struct_declaration in re.finditer(struct_body_regex, all_struct_declarations):
-        struct_body = struct_declaration.group("struct_body")
-
-        fields: dict[str, str] = {}
-        for struct_match in struct_level_regex.finditer(struct_body):
-            field_name = struct_match.group("field_name")
-            field_value = struct_match.group("field_value").strip().strip('"')
-
-            fields[field_name] = field_value
-
-        telecommands.append(
-            TelecommandDefinition(
-                name=fields["tcmd_name"],
-                tcmd_func=fields["tcmd_func"],
-                number_of_args=int(fields["number_of_args"]),
-                readiness_level=fields["readiness_level"],
-            ),
+    all_structs_fields = _parse_struct_array_body(c_code, top_level_matches[0].end())
+    if all_structs_fields is None:
+        msg = (
+            "Expected to find exactly 1 telecommand array in the input code, but the array is "
+            "malformed or empty."
         )
+        raise ValueError(msg)
 
-    return telecommands
+    return [
+        TelecommandDefinition(
+            name=fields["tcmd_name"],
+            tcmd_func=fields["tcmd_func"],
+            number_of_args=int(fields["number_of_args"]),
+            readiness_level=fields["readiness_level"],
+        )
+        for fields in all_structs_fields
+    ]
 
 
 def extract_c_function_docstring(function_name: str, c_code: str) -> str | None:
@@ -128,21 +204,43 @@ def extract_c_function_docstring(function_name: str, c_code: str) -> str | None:
     ```
 
     """
-    pattern = re.compile(
-        rf"(?P<docstring>(///(.*)\s*)+)\s*(?P<return_type>\w+)\s+{function_name}\s*\("
-    )
-    match = pattern.search(c_code)
+    match = _get_docstring_regex(function_name).search(c_code)
     if match:
-        docstring = match.group("docstring")
-        docstring_lines = [
-            line.strip().lstrip("/").strip() for line in docstring.strip().split("\n")
-        ]
-        return "\n".join(docstring_lines)
+        return _clean_docstring(match.group("docstring"))
 
     # If the function is not found, return None
     return None
 
 
+def extract_all_c_function_docstrings(c_code: str | bytes) -> dict[str, str]:
+    """Read the docstrings for every function in the C code, in a single pass.
+
+    Does not support `/* */` style comments, only `///` style comments.
+
+    Args:
+    ----
+        c_code: The C code containing the function definitions. Can be multiple files worth.
+        If given as UTF-8 `bytes`, only the docstrings which are found get decoded.
+
+    Returns:
+    -------
+        A dict mapping each function name to its docstring, with the `///` characters removed (as
+        in `extract_c_function_docstring`). Functions without a docstring are not included. If a
+        function is found multiple times, the first docstring is used.
+
+    """
+    docstrings: dict[str, str] = {}
+
+    # Either regex, to match the type of `c_code`.
+    doc_index_re: re.Pattern = _DOC_INDEX_BYTES_RE if isinstance(c_code, bytes) else _DOC_INDEX_RE
+    for match in doc_index_re.finditer(c_code):
+        function_name = _as_str(match.group("function_name"))
+        if function_name not in docstrings:
+            docstrings[function_name] = _clean_docstring(_as_str(match.group("docstring")))
+
+    return docstrings
+
+
 def extract_telecommand_arg_list(docstring: str) -> list[str] | None:
     """Extract the list of argument descriptions from a telecommand docstring.
 
@@ -180,23 +278,20 @@ def extract_telecommand_arg_list(docstring: str) -> list[str] | None:
     ```
 
     """
-    arg_pattern = re.compile(
-        r"@param args_str.*\n(?P<args>([\s/]*- Arg (?P<arg_num>\d+): (?P<arg_description>.+)\s*)*)"
-    )
-
-    matches = []
-    match = arg_pattern.search(docstring)
-    if not match:
+    args_str_idx = docstring.find("@param args_str")
+    if args_str_idx == -1:
         return None
 
-    args_text = match.group("args")
-    arg_desc_pattern = re.compile(r"- Arg (?P<arg_num>\d+): (?P<arg_description>.+)\s*")
-
-    matches.extend(
-        [arg_match.group("arg_description") for arg_match in arg_desc_pattern.finditer(args_text)]
-    )
+    # The args are the contiguous "- Arg N:" lines, starting on the line after the tag.
+    pos = docstring.find("\n", args_str_idx) + 1
+    if pos == 0:
+        return None
 
-    return matches
+    arg_descriptions: list[str] = []
+    while arg_match := _ARG_DESC_RE.match(docstring, pos):
+        arg_descriptions.append(arg_match.group("arg_description"))
+        pos = arg_match.end()
+    return arg_descriptions
 
 
 def parse_telecommand_list_from_repo(repo_path: Path) -> list[TelecommandDefinition]:
@@ -225,20 +320,19 @@ def parse_telecommand_list_from_repo(repo_path: Path) -> list[TelecommandDefinit
 
     tcmd_list = parse_telecommand_array_table(telecommands_defs_path)
 
-    # Read the files which may contain the TCMDEXEC functions.
-    c_files_concat: str = "\n".join(
-        read_text_file(f) for f in repo_path.glob("firmware/Core/Src/**/*tele*.c")
-    )
+    # Read the files which may contain the TCMDEXEC functions. Reading is I/O-bound, so overlap
+    # the reads in a thread pool. Keep them as bytes, so that only the docstrings get decoded.
+    c_file_paths = list(repo_path.glob("firmware/Core/Src/**/*tele*.c"))
+    with ThreadPoolExecutor(max_workers=max(1, min(32, len(c_file_paths)))) as executor:
+        c_files_concat: bytes = b"\n".join(executor.map(read_binary_file, c_file_paths))
 
     # Extract the docstrings for each telecommand.
-    for tcmd_idx in range(len(tcmd_list)):
-        docstring = extract_c_function_docstring(
-            tcmd_list[tcmd_idx].tcmd_func,
-            c_files_concat,
-        )
+    docstrings_by_func = extract_all_c_function_docstrings(c_files_concat)
+    for tcmd in tcmd_list:
+        docstring = docstrings_by_func.get(tcmd.tcmd_func)
         if docstring is not None:
-            tcmd_list[tcmd_idx].full_docstring = docstring
-            tcmd_list[tcmd_idx].argument_descriptions = extract_telecommand_arg_list(docstring)
+            tcmd.full_docstring = docstring
+            tcmd.argument_descriptions = extract_telecommand_arg_list(docstring)
 
     return tcmd_list
 
@@ -246,4 +340,7 @@ def parse_telecommand_list_from_repo(repo_path: Path) -> list[TelecommandDefinit
 if __name__ == "__main__":
     # Do a demo of the `parse_telecommand_array_table` function
     telecommands = parse_telecommand_list_from_repo(Path(input("Path to repo: ")))
-    print(json.dumps([tcmd.to_dict() for tcmd in telecommands], indent=2))  # noqa: T201
+    telecommands_json = orjson.dumps(
+        [tcmd.to_dict() for tcmd in telecommands], option=orjson.OPT_INDENT_2
+    )
+    print(telecommands_json.decode("utf-8"))  # noqa: T201
@@ -9,7 +9,7 @@ def generate_telecommand_preview(
     arg_list: list[str],
     enable_tssent_suffix: bool,
     tsexec_suffix_value: int | str | None = None,
-    extra_suffix_tags: dict[str, str] | None = None,
+    extra_suffix_tags: dict[str, int | str] | None = None,
 ) -> str:
     """Construct a telecommand preview, as intented to be transmitted.
 
@@ -34,7 +34,7 @@ def generate_telecommand_preview(
 
     arg_str = ",".join(arg_list)
 
-    suffix_tags = {}.copy()
+    suffix_tags: dict[str, int | str] = {}
 
     if enable_tssent_suffix:
         suffix_tags["tssent"] = str(int(round(time.time() * 1000)))
@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TelecommandDefinition:
     """Stores a telecommand definition. from the `telecommand_definitions.c` file."""
 
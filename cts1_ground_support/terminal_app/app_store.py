@@ -1,15 +1,17 @@
 """A singleton class to store the app's state. Also, the instance of that class."""
 
+import itertools
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from sortedcontainers import SortedDict
-
+from cts1_ground_support.terminal_app.app_config import MAX_RX_TX_LOG_ENTRIES
 from cts1_ground_support.terminal_app.app_types import UART_PORT_NAME_DISCONNECTED, RxTxLogEntry
 
 
-@dataclass
+@dataclass(slots=True)
 class AppStore:
     """A singleton class to store the app's state (across all clients)."""
 
@@ -17,21 +19,73 @@ class AppStore:
 
     uart_port_name: str = UART_PORT_NAME_DISCONNECTED
 
-    # `rxtx_log` is a dictionary, where keys are increasing ints by the order the messages were
-    # added/received. Elements are popped from the start, and added to the end.
-    # Type of `rxtx_log`: SortedDict[int, RxTxLogEntry]
-    rxtx_log: SortedDict[int, RxTxLogEntry] = field(
-        default_factory=lambda: SortedDict({0: RxTxLogEntry(b"Start of Log", "notice")})
+    # `rxtx_log` is a deque of `(idx, entry)` pairs, where `idx` is an increasing int by the order
+    # the messages were added/received. Elements are added to the end, and the oldest elements are
+    # dropped from the start once `MAX_RX_TX_LOG_ENTRIES` is reached.
+    rxtx_log: deque[tuple[int, RxTxLogEntry]] = field(
+        default_factory=lambda: deque(
+            [(0, RxTxLogEntry(b"Start of Log", "notice"))], maxlen=MAX_RX_TX_LOG_ENTRIES
+        )
     )
+    next_rxtx_log_idx: int = 1
+    # Incremented each time the log is cleared, so that clients know to re-render it from scratch.
+    rxtx_log_clear_count: int = 0
     server_start_timestamp_sec: float = field(default_factory=time.time)
     last_tx_timestamp_sec: float = 0
-    tx_queue: list[bytes] = field(default_factory=list)
+    tx_queue: deque[bytes] = field(default_factory=deque)
+
+    # Guards `rxtx_log` and `next_rxtx_log_idx`, which the UART thread and the Dash request threads
+    # all modify. Keeps the indices in the log consecutive (no duplicates/gaps).
+    _rxtx_log_lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    @property
+    def rxtx_log_min_idx(self: "AppStore") -> int:
+        """The index of the oldest entry in the RX/TX log."""
+        return self.rxtx_log[0][0]
 
-    uart_log_refresh_rate_ms: int = 500
+    @property
+    def rxtx_log_max_idx(self: "AppStore") -> int:
+        """The index of the newest entry in the RX/TX log."""
+        return self.rxtx_log[-1][0]
+
+    def get_rxtx_log_slice(
+        self: "AppStore", min_idx: int, max_idx: int
+    ) -> list[tuple[int, RxTxLogEntry]]:
+        """Get the `(idx, entry)` pairs of the RX/TX log with `min_idx <= idx <= max_idx`.
+
+        Only walks the log from the newest entry back to `min_idx`, so getting the few newest
+        entries is cheap, even when the log is long.
+        """
+        with self._rxtx_log_lock:
+            # The indices in the log are consecutive, so they map directly to deque positions.
+            log_len = len(self.rxtx_log)
+            first_idx = self.rxtx_log[0][0]
+            start = min(max(min_idx - first_idx, 0), log_len)
+            stop = min(max(max_idx - first_idx + 1, start), log_len)
+            entries = list(
+                itertools.islice(reversed(self.rxtx_log), log_len - stop, log_len - start)
+            )
+        entries.reverse()
+        return entries
 
     def append_to_rxtx_log(self: "AppStore", entry: RxTxLogEntry) -> None:
         """Append a new entry to the RX/TX log."""
-        self.rxtx_log[self.rxtx_log.keys()[-1] + 1] = entry
+        with self._rxtx_log_lock:
+            self.rxtx_log.append((self.next_rxtx_log_idx, entry))
+            self.next_rxtx_log_idx += 1
+
+    def clear_rxtx_log(self: "AppStore") -> None:
+        """Reset the RX/TX log, leaving only a notice that it was reset."""
+        with self._rxtx_log_lock:
+            # Swap in a new deque (rather than clearing in place) so that the log is never empty.
+            self.rxtx_log = deque(
+                [(self.next_rxtx_log_idx, RxTxLogEntry(b"Log Reset", "notice"))],
+                maxlen=MAX_RX_TX_LOG_ENTRIES,
+            )
+            self.next_rxtx_log_idx += 1
+            self.rxtx_log_clear_count += 1
 
 
 app_store = AppStore()
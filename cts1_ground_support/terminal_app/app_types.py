@@ -21,6 +21,17 @@ class RxTxLogEntry:
     entry_type: Literal["transmit", "receive", "notice", "error"]
     timestamp_sec: float = field(default_factory=lambda: time.time())
 
+    # The CSS style, with the spacing used in the log. Set once, as it's used on every render.
+    css_style_with_margin: dict = field(init=False, repr=False, compare=False)
+    # Cache of `to_string()` results, keyed by the display options.
+    _rendered_cache: dict[tuple[bool, bool, bool], str] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+
+    def __post_init__(self: "RxTxLogEntry") -> None:
+        """Precompute the CSS style with the log spacing."""
+        self.css_style_with_margin = self.css_style | {"margin": "0", "lineHeight": "1.1"}
+
     @property
     def css_style(self: "RxTxLogEntry") -> dict:
         """Get the CSS style for the log entry (mostly just color currently)."""
@@ -46,6 +57,25 @@ class RxTxLogEntry:
         auto_format_json: bool,
     ) -> str:
         """Get the text representation of the log entry."""
+        cache_key = (show_end_of_line_chars, show_timestamp, auto_format_json)
+        rendered = self._rendered_cache.get(cache_key)
+        if rendered is None:
+            rendered = self._render_string(
+                show_end_of_line_chars=show_end_of_line_chars,
+                show_timestamp=show_timestamp,
+                auto_format_json=auto_format_json,
+            )
+            self._rendered_cache[cache_key] = rendered
+        return rendered
+
+    def _render_string(
+        self: "RxTxLogEntry",
+        *,
+        show_end_of_line_chars: bool,
+        show_timestamp: bool,
+        auto_format_json: bool,
+    ) -> str:
+        """Make the text representation of the log entry (uncached)."""
         prefix = ""
         if show_timestamp:
             dt = datetime.fromtimestamp(self.timestamp_sec, tz=pytz.timezone("America/Edmonton"))
@@ -0,0 +1,188 @@
+// Clientside callbacks, which run in the browser to avoid a round-trip to the server.
+// Registered in `dash_gui.py` with `ClientsideFunction(namespace="clientside", ...)`.
+
+// Matches the strings and numbers in valid JSON.
+const JSON_STRING_OR_NUMBER_RE = /"(?:[^"\\]|\\.)*"|-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?/g;
+
+function parseExtraSuffixTags(extraSuffixTagsInput) {
+    // Mirrors `_parse_extra_suffix_tags` in `dash_gui.py`. Must stay in sync with it, so that the
+    // command preview matches the sent command.
+    if (!extraSuffixTagsInput) {
+        return {};
+    }
+    let extraSuffixTags;
+    try {
+        extraSuffixTags = JSON.parse(extraSuffixTagsInput);
+    } catch (e) {
+        // Invalid JSON is ignored, like on the server.
+        return {};
+    }
+    if (extraSuffixTags === null || typeof extraSuffixTags !== "object"
+            || Array.isArray(extraSuffixTags)) {
+        return {};
+    }
+    // Values other than strings and integers are stringified differently than in Python (e.g.,
+    // `true` vs `True`), and integer-like keys are moved to the front of the object, so both are
+    // rejected. JS parses `1.0` and `1e3` as integers, so floats are found in the JSON text.
+    const hasFloat = (extraSuffixTagsInput.match(JSON_STRING_OR_NUMBER_RE) || []).some(
+        (token) => !token.startsWith('"') && /[.eE]/.test(token)
+    );
+    const isValid = !hasFloat && Object.entries(extraSuffixTags).every(
+        ([key, value]) => (typeof value === "string" || Number.isSafeInteger(value))
+            && !/^(0|[1-9][0-9]*)$/.test(key)
+    );
+    return isValid ? extraSuffixTags : {};
+}
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    clientside: {
+        collect_arg_values: function(...everyArgValue) {
+            return everyArgValue;
+        },
+
+        generate_command_preview: function(
+            selectedCommandName,
+            suffixTagsChecklist,
+            tsexecSuffixTag,
+            extraSuffixTagsInput,
+            everyArgValue,
+            telecommandArgCounts
+        ) {
+            // Mirrors `generate_telecommand_preview` in `telecommand_preview.py`.
+            if (!selectedCommandName) {
+                return window.dash_clientside.no_update;
+            }
+            everyArgValue = everyArgValue || [];
+            telecommandArgCounts = telecommandArgCounts || {};
+            const numberOfArgs = telecommandArgCounts[selectedCommandName] || 0;
+
+            // Replace null with empty string, to avoid "null" in the preview.
+            const argVals = Array.from({length: numberOfArgs}, (_, i) => everyArgValue[i]).map(
+                (arg) => (arg === null || arg === undefined) ? "" : String(arg)
+            );
+
+            const suffixTags = {};
+            if ((suffixTagsChecklist || []).includes("enable_tssent_tag")) {
+                suffixTags["tssent"] = String(Date.now());
+            }
+            if (tsexecSuffixTag) {
+                suffixTags["tsexec"] = tsexecSuffixTag;
+            }
+            // Use the extra suffix tags to override the rest of the suffix tags.
+            Object.assign(suffixTags, parseExtraSuffixTags(extraSuffixTagsInput));
+
+            const suffixStr = Object.entries(suffixTags).map(
+                ([key, value]) => `@${key}=${value}`
+            ).join("");
+            return `CTS1+${selectedCommandName}(${argVals.join(",")})${suffixStr}!`;
+        },
+
+        render_command_preview: function(commandPreview) {
+            // Make an area with the command preview for the selected telecommand.
+            return [
+                {
+                    type: "H4",
+                    namespace: "dash_html_components",
+                    props: {children: ["Command Preview"], className: "text-center"},
+                },
+                {
+                    type: "Pre",
+                    namespace: "dash_html_components",
+                    props: {children: commandPreview, id: "command-preview", className: "mb-3"},
+                },
+            ];
+        },
+
+        toggle_pause: function(nClicks, rxtxLogRenderState) {
+            if (nClicks % 2 === 0) {
+                // Set to running.
+                return [
+                    {paused: false, pause_min_idx: null, pause_max_idx: null},
+                    "Pause ⏸️",
+                    "danger",
+                    false,  // Re-enable the log update interval.
+                ];
+            }
+
+            // Pausing, at the index range which was last rendered.
+            const indexRange = rxtxLogRenderState || {};
+            return [
+                {
+                    paused: true,
+                    pause_min_idx: indexRange.min_idx ?? null,
+                    pause_max_idx: indexRange.max_idx ?? null,
+                },
+                "Resume ▶️",
+                "success",
+                true,  // Stop the log update interval.
+            ];
+        },
+
+        parse_display_options: function(displayOptionsChecklist) {
+            const checked = displayOptionsChecklist || [];
+            return {
+                show_end_of_line_chars: checked.includes("show_end_of_line_chars"),
+                show_timestamp: checked.includes("show_timestamp"),
+                auto_format_json: checked.includes("auto_format_json"),
+            };
+        },
+
+        record_last_tx_timestamp: function(nClicksSend, rxtxLogUpdate, lastTxTimestampSec) {
+            const now = Date.now() / 1000;
+            if (window.dash_clientside.callback_context.triggered_id === "send-button") {
+                return now;
+            }
+
+            // New log entries arrived, along with the time since any client last transmitted.
+            const lastTxAgeSec = (rxtxLogUpdate || {}).last_tx_age_sec;
+            if (lastTxAgeSec === undefined || lastTxAgeSec === null) {
+                return window.dash_clientside.no_update;
+            }
+            const serverLastTxTimestampSec = now - lastTxAgeSec;
+            // Ignore differences under a second, from the request's latency.
+            if (serverLastTxTimestampSec > (lastTxTimestampSec || 0) + 1) {
+                return serverLastTxTimestampSec;
+            }
+            return window.dash_clientside.no_update;
+        },
+
+        update_uart_log_refresh_interval: function(nIntervals, lastTxTimestampSec, currentInterval) {
+            const secSinceSend = Date.now() / 1000 - (lastTxTimestampSec || 0);
+            let interval;
+            if (secSinceSend < 10) {
+                // Rapid refreshed right after sending a command.
+                interval = 250;
+            } else if (secSinceSend < 60) {
+                // Chill if it's been a while since the last command.
+                interval = 800;
+            } else {
+                // Slow down if it's been a long time since the last command.
+                interval = 2000;
+            }
+            // Only update on change, as setting the interval restarts the timer.
+            return (interval === currentInterval) ? window.dash_clientside.no_update : interval;
+        },
+
+        append_rxtx_log_entries: function(rxtxLogUpdate, currentChildren) {
+            // Add the entries sent by `update_uart_log_interval` to the rendered log.
+            if (!rxtxLogUpdate || !rxtxLogUpdate.entries) {
+                return window.dash_clientside.no_update;
+            }
+            const newChildren = rxtxLogUpdate.entries.map((entry) => ({
+                type: "Pre",
+                namespace: "dash_html_components",
+                props: {children: entry.text, style: entry.style},
+            }));
+            const children = rxtxLogUpdate.reset
+                ? newChildren
+                : (currentChildren || []).concat(newChildren);
+
+            // Drop the oldest entries, like the log on the server does.
+            const maxEntries = rxtxLogUpdate.max_entries;
+            if (maxEntries && children.length > maxEntries) {
+                return children.slice(children.length - maxEntries);
+            }
+            return children;
+        },
+    },
+});
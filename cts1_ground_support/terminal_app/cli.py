@@ -0,0 +1,82 @@
+"""Command-line entry point for the terminal app.
+
+Kept separate from `dash_gui.py`, so that parsing the CLI args (e.g., `--help`) doesn't import
+Dash, which is slow to import.
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from loguru import logger
+
+from cts1_ground_support.paths import clone_firmware_repo, get_repo_commit_hash
+from cts1_ground_support.terminal_app.app_store import app_store
+
+
+def main() -> None:
+    """Run the main server, with optional debug mode (via CLI arg)."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-r",
+        "--repo",
+        "--firmware-repo",
+        dest="firmware_repo",
+        type=str,
+        help=(
+            "Path to the root of the CTS-SAT-1-OBC-Firmware repository, for reading telecommand "
+            "list. "
+            "If not provided, the repo will automatically be cloned to a temporary directory."
+        ),
+    )
+    parser.add_argument(
+        "-d",
+        "--debug",
+        action="store_true",
+        help="Enable debug mode for the Dash app.",
+    )
+    parser.add_argument(
+        "-a",
+        "--advanced",
+        action="store_true",
+        help="Enable advanced features for ground debugging, like the extra suffix tags input.",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if args.firmware_repo is None:
+            firmware_repo_path = clone_firmware_repo(Path(tmp_dir))
+            logger.info(
+                "Cloned CTS-SAT-1-OBC-Firmware repo to temporary directory "
+                f"(commit={get_repo_commit_hash(firmware_repo_path)}): {tmp_dir}"
+            )
+        else:
+            firmware_repo_path = Path(args.firmware_repo)
+
+            if not firmware_repo_path.is_dir():
+                msg = f"Provided CTS-SAT-1-OBC-Firmware repo not found: {args.firmware_repo}"
+                raise FileNotFoundError(msg)
+
+            logger.info(f"Using provided CTS-SAT-1-OBC-Firmware repo: {args.firmware_repo}")
+
+        app_store.firmware_repo_path = firmware_repo_path
+
+        # Import the GUI only once it's needed, as importing Dash is slow (e.g., for `--help`).
+        from cts1_ground_support.terminal_app.dash_gui import (  # noqa: PLC0415
+            get_telecommand_name_list,
+            run_dash_app,
+        )
+
+        logger.info(
+            f"CTS-SAT-1-OBC-Firmware repo contains {len(get_telecommand_name_list())} "
+            "telecommands."
+        )
+
+        run_dash_app(
+            enable_debug=args.debug,
+            enable_advanced=args.advanced,
+        )
+
+
+if __name__ == "__main__":
+    main()
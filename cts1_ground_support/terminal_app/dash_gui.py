@@ -7,47 +7,67 @@ The main screen has the following components:
 (occupies the right 70% of the screen).
 """
 
-import argparse
 import functools
-import json
-import tempfile
+import re
 import time
 from pathlib import Path
 
 import dash
 import dash_bootstrap_components as dbc
 import dash_split_pane
-from dash import callback, dcc, html
-from dash.dependencies import Input, Output, State
+import orjson
+from dash import callback, clientside_callback, dcc, html
+from dash.dependencies import ClientsideFunction, Input, Output, State
 from loguru import logger
-from sortedcontainers import SortedDict
 
-from cts1_ground_support.paths import clone_firmware_repo
+from cts1_ground_support.caching import ttl_cache
 from cts1_ground_support.serial import list_serial_ports
 from cts1_ground_support.telecommand_array_parser import parse_telecommand_list_from_repo
 from cts1_ground_support.telecommand_preview import generate_telecommand_preview
 from cts1_ground_support.telecommand_types import TelecommandDefinition
-from cts1_ground_support.terminal_app.app_config import MAX_ARGS_PER_TELECOMMAND
+from cts1_ground_support.terminal_app.app_config import (
+    MAX_ARGS_PER_TELECOMMAND,
+    MAX_RX_TX_LOG_ENTRIES,
+)
 from cts1_ground_support.terminal_app.app_store import app_store
 from cts1_ground_support.terminal_app.app_types import UART_PORT_NAME_DISCONNECTED, RxTxLogEntry
 from cts1_ground_support.terminal_app.serial_thread import start_uart_listener
 
 UART_PORT_OPTION_LABEL_DISCONNECTED = "⛔ Disconnected ⛔"
 
+# Keys which JS orders before all other keys in an object (array indices).
+_INTEGER_LIKE_KEY_RE = re.compile(r"0|[1-9][0-9]*")
+# Integers beyond this can't be represented exactly in JS (`Number.MAX_SAFE_INTEGER`).
+_MAX_JS_SAFE_INTEGER = 2**53 - 1
+
 # TODO: log the UART comms to a file
 # TODO: fix the connect/disconnect loop when multiple clients are connected
 #   ^ Ideas: Add an "Apply" button to change the port, or a mechanism where the "default-on-load"
 #            value comes from the app_store's latest connected port (esp on load).
 
 
-# TODO: Change this to a TTL cache so that it refreshes sometimes, maybe.
-@functools.lru_cache  # Cache forever is fine.
+@ttl_cache(ttl_sec=300)
 def get_telecommand_list_from_repo_cached(repo_path: Path | None) -> list[TelecommandDefinition]:
-    """Get the telecommand list from a repo, and cache the result."""
+    """Get the telecommand list from a repo, and cache the result for a few minutes.
+
+    When the cache expires, the repo is re-parsed the next time this is called (e.g., on page
+    load), so that changes to the telecommands are picked up without restarting the server.
+    """
     if repo_path is None:
         return []
 
-    return parse_telecommand_list_from_repo(repo_path)
+    telecommands = parse_telecommand_list_from_repo(repo_path)
+    _clear_telecommand_derived_caches()
+    return telecommands
+
+
+def _clear_telecommand_derived_caches() -> None:
+    """Clear the caches of values derived from the telecommand list, after it's re-parsed."""
+    _get_telecommand_names_cached.cache_clear()
+    _get_telecommand_dropdown_options_cached.cache_clear()
+    _get_telecommand_index_cached.cache_clear()
+    _build_arg_inputs.cache_clear()
+    _build_tcmd_info_children.cache_clear()
 
 
 def get_telecommand_list_from_repo() -> list[TelecommandDefinition]:
@@ -55,28 +75,58 @@ def get_telecommand_list_from_repo() -> list[TelecommandDefinition]:
     return get_telecommand_list_from_repo_cached(app_store.firmware_repo_path)
 
 
+@functools.lru_cache
+def _get_telecommand_names_cached(repo_path: Path | None) -> tuple[str, ...]:
+    """Get the names of the telecommands from a repo, and cache the result."""
+    return tuple(tcmd.name for tcmd in get_telecommand_list_from_repo_cached(repo_path))
+
+
 def get_telecommand_name_list() -> list[str]:
     """Get a list of telecommand names by reading the telecommands from the repo."""
-    telecommands = get_telecommand_list_from_repo()
-    return [tcmd.name for tcmd in telecommands]
+    return list(_get_telecommand_names_cached(app_store.firmware_repo_path))
+
+
+@functools.lru_cache
+def _get_telecommand_dropdown_options_cached(repo_path: Path | None) -> tuple[dict[str, str], ...]:
+    """Get the options for the telecommand dropdown, and cache the result."""
+    return tuple(
+        {"label": name, "value": name} for name in _get_telecommand_names_cached(repo_path)
+    )
+
+
+@functools.lru_cache
+def _get_telecommand_index_cached(repo_path: Path | None) -> dict[str, TelecommandDefinition]:
+    """Get a dict of the telecommands from a repo, keyed by name, and cache the result."""
+    return {tcmd.name: tcmd for tcmd in get_telecommand_list_from_repo_cached(repo_path)}
 
 
 def get_telecommand_by_name(name: str) -> TelecommandDefinition:
     """Get a telecommand definition by name."""
-    telecommands = get_telecommand_list_from_repo()
-    telecommand = next((tcmd for tcmd in telecommands if tcmd.name == name), None)
-    if not telecommand:
+    try:
+        return _get_telecommand_index_cached(app_store.firmware_repo_path)[name]
+    except KeyError:
         msg = f"Telecommand not found: {name}"
-        raise ValueError(msg)
-    return telecommand
+        raise ValueError(msg) from None
 
 
+# Update everything which depends on the selected telecommand in one callback, rather than one
+# callback (and request) per area. The command preview is updated in the browser instead.
 @callback(
     Output("argument-inputs-container", "children"),
+    Output("selected-tcmd-info-container", "children"),
     Input("telecommand-dropdown", "value"),
 )
-def update_argument_inputs(selected_command_name: str) -> list[html.Div]:
-    """Generate the argument input fields based on the selected telecommand."""
+def update_selected_tcmd_areas(selected_command_name: str) -> tuple[list, list]:
+    """Generate the argument input fields and the info area for the selected telecommand."""
+    return (
+        list(_build_arg_inputs(selected_command_name)),
+        list(_build_tcmd_info_children(selected_command_name)),
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _build_arg_inputs(selected_command_name: str) -> tuple[dbc.FormFloating, ...]:
+    """Build the argument input fields for a telecommand, and cache the result."""
     selected_tcmd = get_telecommand_by_name(selected_command_name)
 
     arg_inputs = []
@@ -109,7 +159,24 @@ def update_argument_inputs(selected_command_name: str) -> list[html.Div]:
             )
         )
 
-    return arg_inputs
+    return tuple(arg_inputs)
+
+
+@ttl_cache(ttl_sec=2)
+def _list_serial_ports_cached() -> tuple[str, ...]:
+    """List the available serial ports, and cache the result briefly (listing them is slow)."""
+    return tuple(list_serial_ports())
+
+
+@functools.lru_cache(maxsize=16)
+def _get_uart_port_dropdown_options_cached(
+    port_names: tuple[str, ...],
+) -> tuple[dict[str, str], ...]:
+    """Get the options for the UART port dropdown, and cache the result."""
+    return (
+        {"label": UART_PORT_OPTION_LABEL_DISCONNECTED, "value": UART_PORT_NAME_DISCONNECTED},
+        *({"label": port, "value": port} for port in port_names),
+    )
 
 
 def handle_uart_port_change(uart_port_name: str) -> None:
@@ -134,29 +201,56 @@ def handle_uart_port_change(uart_port_name: str) -> None:
     app_store.uart_port_name = uart_port_name
 
 
-@callback(
-    Output("stored-command-preview", "data"),
-    Input("telecommand-dropdown", "value"),
-    Input("suffix-tags-checklist", "value"),
-    Input("input-tsexec-suffix-tag", "value"),
-    Input("extra-suffix-tags-input", "value"),  # Advanced feature for debugging
-    Input("uart-update-interval-component", "n_intervals"),
-    # TODO: Maybe this could be cleaner with `Input/State("argument-inputs-container", "children")`
-    *[Input(f"arg-input-{arg_num}", "value") for arg_num in range(MAX_ARGS_PER_TELECOMMAND)],
-    prevent_initial_call=True,  # Objects aren't created yet, so errors are thrown.
-)
-def update_stored_command_preview(
+@functools.lru_cache(maxsize=64)
+def _parse_extra_suffix_tags(extra_suffix_tags_input: str | None) -> dict[str, int | str]:
+    """Parse the JSON from the extra-suffix-tags-input field, and cache the result.
+
+    Returns an empty dict if the input is empty or invalid. The result is shared between calls, so
+    it must not be modified.
+
+    Must stay in sync with `parseExtraSuffixTags` in `assets/clientside_callbacks.js`, so that the
+    command preview matches the sent command. Values must be strings or integers, as JS and Python
+    stringify other values differently (e.g., `true` vs `True`, or `1` vs `1.0`). Integer-like keys
+    are rejected, as JS moves them to the front of the object.
+    """
+    if not extra_suffix_tags_input:
+        return {}
+
+    try:
+        extra_suffix_tags = orjson.loads(extra_suffix_tags_input)
+    except orjson.JSONDecodeError as e:
+        logger.error(f"Error decoding JSON in extra-suffix-tags-input field: {e}")
+        return {}
+
+    if not isinstance(extra_suffix_tags, dict):
+        logger.error(f"Extra suffix tags input is not a dictionary: {extra_suffix_tags}")
+        return {}
+
+    for key, value in extra_suffix_tags.items():
+        is_js_safe_int = (
+            isinstance(value, int)
+            and not isinstance(value, bool)
+            and abs(value) <= _MAX_JS_SAFE_INTEGER
+        )
+        if not (isinstance(value, str) or is_js_safe_int):
+            logger.error(f"Extra suffix tag value must be a string or integer: {key}={value!r}")
+            return {}
+        if _INTEGER_LIKE_KEY_RE.fullmatch(key):
+            logger.error(f"Extra suffix tag key must not be an integer: {key}")
+            return {}
+
+    return extra_suffix_tags
+
+
+def _generate_command_preview_from_inputs(
+    *,
     selected_command_name: str,
     suffix_tags_checklist: list[str] | None,
     tsexec_suffix_tag: str | None,
-    extra_suffix_tags_input: str,
-    _n_intervals: int,
-    *every_arg_value: str,
+    extra_suffix_tags_input: str | None,
+    every_arg_value: tuple[str | None, ...],
 ) -> str:
-    """When any input to the command preview changes, regenerate the command preview.
-
-    Stores the command preview so that it's accessible from any function which wants it.
-    """
+    """Generate the command preview from the values of the input fields in the GUI."""
     # Prep incoming args.
     if suffix_tags_checklist is None:
         suffix_tags_checklist = []
@@ -166,58 +260,75 @@ def update_stored_command_preview(
 
     # Get the selected command and its arguments.
     selected_command = get_telecommand_by_name(selected_command_name)
-    arg_vals = [every_arg_value[arg_num] for arg_num in range(selected_command.number_of_args)]
-
     # Replace None with empty string, to avoid "None" in the preview.
-    arg_vals: list[str] = [str(arg) if arg is not None else "" for arg in arg_vals]
+    arg_vals: list[str] = [
+        str(arg) if arg is not None else ""
+        for arg in every_arg_value[: selected_command.number_of_args]
+    ]
 
     enable_tssent_suffix = "enable_tssent_tag" in suffix_tags_checklist
 
-    extra_suffix_tags = {}
-    if extra_suffix_tags_input:
-        try:
-            extra_suffix_tags = json.loads(extra_suffix_tags_input)
-        except json.JSONDecodeError as e:
-            logger.error(f"Error decoding JSON in extra-suffix-tags-input field: {e}")
-
-        if not isinstance(extra_suffix_tags, dict):
-            logger.error(f"Extra suffix tags input is not a dictionary: {extra_suffix_tags}")
-            extra_suffix_tags = {}
+    extra_suffix_tags = _parse_extra_suffix_tags(extra_suffix_tags_input)
 
     return generate_telecommand_preview(
         tcmd_name=selected_command_name,
         arg_list=arg_vals,
         enable_tssent_suffix=enable_tssent_suffix,
         tsexec_suffix_value=tsexec_suffix_tag,
-        extra_suffix_tags=extra_suffix_tags.copy(),
+        extra_suffix_tags=extra_suffix_tags,  # Not modified, so no need to copy it.
     )
 
 
-@callback(
+# Collect the values of all the argument inputs into one list (in the browser), so that other
+# callbacks can depend on a single Store rather than on every argument input.
+# Not `prevent_initial_call`, so that it also runs when the argument inputs are re-rendered.
+clientside_callback(
+    ClientsideFunction(namespace="clientside", function_name="collect_arg_values"),
+    Output("stored-arg-values", "data"),
+    *[Input(f"arg-input-{arg_num}", "value") for arg_num in range(MAX_ARGS_PER_TELECOMMAND)],
+)
+
+
+# When any input to the command preview changes, regenerate the command preview in the browser.
+# Stores the command preview so that it's accessible from any function which wants it.
+# See `assets/clientside_callbacks.js`, which mirrors `_generate_command_preview_from_inputs`.
+clientside_callback(
+    ClientsideFunction(namespace="clientside", function_name="generate_command_preview"),
+    Output("stored-command-preview", "data"),
+    Input("telecommand-dropdown", "value"),
+    Input("suffix-tags-checklist", "value"),
+    Input("input-tsexec-suffix-tag", "value"),
+    Input("extra-suffix-tags-input", "value"),  # Advanced feature for debugging
+    Input("stored-arg-values", "data"),
+    State("stored-telecommand-arg-counts", "data"),
+    prevent_initial_call=True,  # Objects aren't created yet, so errors are thrown.
+)
+
+
+# Make an area with the command preview for the selected telecommand (in the browser).
+clientside_callback(
+    ClientsideFunction(namespace="clientside", function_name="render_command_preview"),
     Output("command-preview-container", "children"),
     Input("stored-command-preview", "data"),
 )
-def update_command_preview_render(command_preview: str) -> list:
-    """Make an area with the command preview for the selected telecommand."""
-    return [
-        html.H4(["Command Preview"], className="text-center"),
-        html.Pre(command_preview, id="command-preview", className="mb-3"),
-    ]
 
 
 @callback(
     Input("send-button", "n_clicks"),
     State("telecommand-dropdown", "value"),
-    State("stored-command-preview", "data"),
-    # TODO: Maybe this could be cleaner with `Input/State("argument-inputs-container", "children")`
-    *[State(f"arg-input-{arg_num}", "value") for arg_num in range(MAX_ARGS_PER_TELECOMMAND)],
+    State("suffix-tags-checklist", "value"),
+    State("input-tsexec-suffix-tag", "value"),
+    State("extra-suffix-tags-input", "value"),
+    State("stored-arg-values", "data"),
     prevent_initial_call=True,
 )
-def send_button_callback(
+def send_button_callback(  # noqa: PLR0913, PLR0917
     n_clicks: int,
     selected_command_name: str | None,
-    command_preview: str,
-    *every_arg_value: tuple[str],
+    suffix_tags_checklist: list[str] | None,
+    tsexec_suffix_tag: str | None,
+    extra_suffix_tags_input: str | None,
+    every_arg_value: list[str | None] | None,
 ) -> None:
     """Handle the send button click event by adding the command to the TX queue."""
     logger.info(f"Send button clicked ({n_clicks=})!")
@@ -228,10 +339,12 @@ def send_button_callback(
         app_store.append_to_rxtx_log(RxTxLogEntry(msg.encode(), "error"))
         return
 
-    args = [
-        every_arg_value[arg_num]
-        for arg_num in range(get_telecommand_by_name(selected_command_name).number_of_args)
-    ]
+    if every_arg_value is None:
+        every_arg_value = []
+
+    number_of_args = get_telecommand_by_name(selected_command_name).number_of_args
+    args = list(every_arg_value[:number_of_args])
+    args += [None] * (number_of_args - len(args))
     if any(arg is None or arg == "" for arg in args):
         msg = f"Not all arguments are filled in. Can't run {selected_command_name}{args}!"
         logger.error(msg)
@@ -244,12 +357,33 @@ def send_button_callback(
         app_store.append_to_rxtx_log(RxTxLogEntry(msg.encode(), "error"))
         return
 
+    # Regenerate the command (rather than using the stored preview), so that the timestamp in the
+    # `tssent` suffix tag is current.
+    command_preview = _generate_command_preview_from_inputs(
+        selected_command_name=selected_command_name,
+        suffix_tags_checklist=suffix_tags_checklist,
+        tsexec_suffix_tag=tsexec_suffix_tag,
+        extra_suffix_tags_input=extra_suffix_tags_input,
+        every_arg_value=tuple(every_arg_value),
+    )
     logger.info(f"Adding command to queue: {command_preview}")
 
-    app_store.last_tx_timestamp_sec = time.time()
     app_store.tx_queue.append(command_preview.encode("ascii"))
 
 
+# Record when a command was last transmitted (in the browser's clock), so that the log can be
+# refreshed rapidly right after. Updated when this client clicks send, and when the server reports
+# a transmission (from any client) along with new log entries.
+clientside_callback(
+    ClientsideFunction(namespace="clientside", function_name="record_last_tx_timestamp"),
+    Output("stored-last-tx-timestamp-sec", "data"),
+    Input("send-button", "n_clicks"),
+    Input("stored-rxtx-log-update", "data"),
+    State("stored-last-tx-timestamp-sec", "data"),
+    prevent_initial_call=True,
+)
+
+
 @callback(
     Input("clear-log-button", "n_clicks"),
     prevent_initial_call=True,
@@ -258,50 +392,21 @@ def clear_log_button_callback(n_clicks: int) -> None:
     """Handle the "Clear Log" button click event by resetting the log."""
     logger.info(f"Clear Log button clicked ({n_clicks=})!")
 
-    max_rxtx_log_index = app_store.rxtx_log.keys()[-1]
-    app_store.rxtx_log = SortedDict(
-        {
-            max_rxtx_log_index + 1: RxTxLogEntry(b"Log Reset", "notice"),
-        }
-    ).copy()
+    app_store.clear_rxtx_log()
 
 
-@callback(
+# Handle the pause button click event by toggling the pause button state (in the browser).
+# When pausing, the log is frozen at the index range which was last rendered, and the log update
+# interval is stopped, so that the server does no work for this client until it's resumed.
+clientside_callback(
+    ClientsideFunction(namespace="clientside", function_name="toggle_pause"),
     Output("stored-rxtx-log-pause-limits", "data"),
     Output("pause-button", "children"),
     Output("pause-button", "color"),
+    Output("uart-update-interval-component", "disabled"),
     Input("pause-button", "n_clicks"),
+    State("stored-rxtx-log-render-state", "data"),
 )
-def pause_button_callback(n_clicks: int) -> tuple[dict[str, int | bool | None], str, str]:
-    """Handle the pause button click event by toggling the pause button state."""
-    logger.info(f"Pause button clicked ({n_clicks=})!")
-
-    if n_clicks % 2 == 0:
-        # Set to running.
-        logger.info("Setting to running")
-        return (
-            {
-                "paused": False,
-                "pause_min_idx": None,
-                "pause_max_idx": None,
-            },
-            "Pause ⏸️",
-            "danger",
-        )
-
-    # Pausing.
-    pause_min_idx = app_store.rxtx_log.keys()[0]
-    pause_max_idx = app_store.rxtx_log.keys()[-1]
-    logger.info(f"Setting to paused: {pause_min_idx=}, {pause_max_idx=}")
-    return (
-        {
-            "paused": True,
-            "pause_min_idx": pause_min_idx,
-            "pause_max_idx": pause_max_idx,
-        },
-        "Resume ▶️",
-        "success",
-    )
 
 
 @callback(
@@ -318,7 +423,7 @@ def update_uart_port_dropdown_options(
     handle_uart_port_change(uart_port_name)
 
     # Re-render the dropdown with the updated list of serial ports.
-    port_name_list = list_serial_ports()
+    port_name_list = _list_serial_ports_cached()
     if app_store.uart_port_name not in ([*port_name_list, UART_PORT_NAME_DISCONNECTED]):
         msg = f"Serial port is no longer available in list of ports: {app_store.uart_port_name}"
         logger.warning(msg)
@@ -330,17 +435,12 @@ def update_uart_port_dropdown_options(
 
     # NOTE: Don't try to update the dropdown options in the callback, as it will trigger the
     # callback again and infinitely toggle between connected and disconnected.
-    return [
-        {"label": UART_PORT_OPTION_LABEL_DISCONNECTED, "value": UART_PORT_NAME_DISCONNECTED}
-    ] + [{"label": port, "value": port} for port in port_name_list]
+    return list(_get_uart_port_dropdown_options_cached(port_name_list))
 
 
-@callback(
-    Output("selected-tcmd-info-container", "children"),
-    Input("telecommand-dropdown", "value"),
-)
-def update_selected_tcmd_info(selected_command_name: str) -> list:
-    """Make an area with the docstring for the selected telecommand."""
+@functools.lru_cache(maxsize=256)
+def _build_tcmd_info_children(selected_command_name: str) -> tuple:
+    """Build the info area for a telecommand, and cache the result."""
     selected_command = get_telecommand_by_name(selected_command_name)
 
     if selected_command.full_docstring is None:
@@ -367,105 +467,149 @@ def update_selected_tcmd_info(selected_command_name: str) -> list:
         [table_header, table_body], bordered=True, striped=True, hover=True, responsive=True
     )
 
-    return [
+    return (
         html.H4(["Command Info"], className="text-center"),
         table,
         html.Hr(),
         html.H4(["Command Docstring"], className="text-center"),
         # TODO: add the "brief" docstring here, and then hide the rest in a "Click to expand"
         html.Pre(docstring, id="selected-tcmd-info", className="mb-3"),
-    ]
+    )
 
 
-def generate_rx_tx_log(
+def generate_rx_tx_log_entries(
     *,
+    min_idx: int,
+    max_idx: int,
     show_end_of_line_chars: bool = False,
     show_timestamp: bool = False,
     auto_format_json: bool = False,
-    pause_min_idx: int | None = None,
-    pause_max_idx: int | None = None,
-) -> html.Div:
-    """Generate the RX/TX log, which shows the most recent received and transmitted messages."""
-    if pause_min_idx is None:
-        pause_min_idx = app_store.rxtx_log.keys()[0]
-    if pause_max_idx is None:
-        pause_max_idx = app_store.rxtx_log.keys()[-1]
-
-    logger.info(f"Showing log: {pause_min_idx=}, {pause_max_idx=}")
-
-    return html.Div(
-        [
-            html.Pre(
-                entry.to_string(
-                    show_end_of_line_chars=show_end_of_line_chars,
-                    show_timestamp=show_timestamp,
-                    auto_format_json=auto_format_json,
-                ),
-                style=(entry.css_style | {"margin": "0", "lineHeight": "1.1"}),
-            )
-            for idx, entry in app_store.rxtx_log.items()
-            if (idx >= pause_min_idx) and (idx <= pause_max_idx)
-        ],
-        id="rx-tx-log",
-        className="p-3",
-        style={
-            "display": "block",
-            "width": "fit-content",  # Make the horizontal scrollbar work correctly.
-        },
-    )
+) -> list[dict]:
+    """Generate the RX/TX log entries with `min_idx <= idx <= max_idx`, for the browser to render.
+
+    Each entry is a dict with the entry's text and CSS style.
+    """
+    return [
+        {
+            "text": entry.to_string(
+                show_end_of_line_chars=show_end_of_line_chars,
+                show_timestamp=show_timestamp,
+                auto_format_json=auto_format_json,
+            ),
+            "style": entry.css_style_with_margin,
+        }
+        for _idx, entry in app_store.get_rxtx_log_slice(min_idx, max_idx)
+    ]
+
+
+# Convert the display options checklist to a dict of flags (in the browser).
+clientside_callback(
+    ClientsideFunction(namespace="clientside", function_name="parse_display_options"),
+    Output("stored-display-options", "data"),
+    Input("display-options-checklist", "value"),
+)
+
+
+# Append the new RX/TX log entries (or replace all of them, on reset) in the browser.
+clientside_callback(
+    ClientsideFunction(namespace="clientside", function_name="append_rxtx_log_entries"),
+    Output("rx-tx-log", "children"),
+    Input("stored-rxtx-log-update", "data"),
+    State("rx-tx-log", "children"),
+    prevent_initial_call=True,
+)
+
+
+# Update the log refresh interval (in the browser), based on how long ago a command was sent.
+clientside_callback(
+    ClientsideFunction(namespace="clientside", function_name="update_uart_log_refresh_interval"),
+    Output("uart-update-interval-component", "interval"),
+    Input("uart-update-interval-component", "n_intervals"),
+    Input("stored-last-tx-timestamp-sec", "data"),
+    State("uart-update-interval-component", "interval"),
+)
 
 
 # Should be the last callback in the file, as other callbacks modify the log.
 @callback(
-    Output("rx-tx-log-container", "children"),
-    Output("uart-update-interval-component", "interval"),
-    Input("uart-port-dropdown", "value"),
-    Input("send-button", "n_clicks"),
-    Input("clear-log-button", "n_clicks"),
+    Output("stored-rxtx-log-update", "data"),
+    Output("stored-rxtx-log-render-state", "data"),
     Input("uart-update-interval-component", "n_intervals"),
-    Input("display-options-checklist", "value"),
-    Input("stored-rxtx-log-pause-limits", "data"),
+    Input("stored-display-options", "data"),
+    # Not an Input, as the interval is stopped while paused, and catches up on the next tick.
+    State("stored-rxtx-log-pause-limits", "data"),
+    State("stored-rxtx-log-render-state", "data"),
 )
 def update_uart_log_interval(
-    _uart_port_name: str,
-    _n_clicks_send: int,
-    _n_clicks_clear_logs: int,
     _update_interval_count: int,
-    display_options_checklist: list[str] | None,
+    display_options: dict[str, bool] | None,
     stored_rxtx_log_pause_limits: dict[str, int | bool | None],
-) -> tuple[html.Div, int]:
-    """Update the UART log at the specified interval. Also, update the refresh interval."""
-    sec_since_send = time.time() - app_store.last_tx_timestamp_sec
-    if sec_since_send < 10:  # noqa: PLR2004
-        # Rapid refreshed right after sending a command.
-        app_store.uart_log_refresh_rate_ms = 250
-    elif sec_since_send < 60:  # noqa: PLR2004
-        # Chill if it's been a while since the last command.
-        app_store.uart_log_refresh_rate_ms = 800
-    else:
-        # Slow down if it's been a long time since the last command.
-        app_store.uart_log_refresh_rate_ms = 2000
+    rxtx_log_render_state: dict | None,
+) -> tuple:
+    """Update the UART log at the specified interval.
 
-    if display_options_checklist:
-        show_end_of_line_chars = "show_end_of_line_chars" in display_options_checklist
-        show_timestamp = "show_timestamp" in display_options_checklist
-        auto_format_json = "auto_format_json" in display_options_checklist
+    Only the entries which this client has not rendered yet are sent, unless the log must be
+    re-rendered from scratch (e.g., the display options changed, or the log was cleared).
+    """
+    if display_options is None:
+        display_options = {}
+
+    if rxtx_log_render_state is None:
+        rxtx_log_render_state = {}
+
+    # The index range of the log to show. Frozen at the last rendered range while paused.
+    min_idx = app_store.rxtx_log_min_idx
+    max_idx = app_store.rxtx_log_max_idx
+    if stored_rxtx_log_pause_limits.get("paused"):
+        pause_min_idx = stored_rxtx_log_pause_limits.get("pause_min_idx")
+        pause_max_idx = stored_rxtx_log_pause_limits.get("pause_max_idx")
+        if pause_min_idx is not None:
+            min_idx = int(pause_min_idx)
+        if pause_max_idx is not None:
+            max_idx = int(pause_max_idx)
+
+    rendered_max_idx = rxtx_log_render_state.get("max_idx")
+    if (
+        rendered_max_idx is not None
+        and rxtx_log_render_state.get("display_options") == display_options
+        and rxtx_log_render_state.get("clear_count") == app_store.rxtx_log_clear_count
+    ):
+        # Only send the entries which this client has not rendered yet.
+        is_reset = False
+        from_idx = rendered_max_idx + 1
+        if from_idx > max_idx:
+            # Nothing new to show.
+            return dash.no_update, dash.no_update
+        min_idx = rxtx_log_render_state.get("min_idx", min_idx)
     else:
-        show_end_of_line_chars = False
-        show_timestamp = False
-        auto_format_json = False
-
-    return (
-        # New log entries.
-        generate_rx_tx_log(
-            show_end_of_line_chars=show_end_of_line_chars,
-            show_timestamp=show_timestamp,
-            auto_format_json=auto_format_json,
-            pause_min_idx=stored_rxtx_log_pause_limits.get("pause_min_idx"),
-            pause_max_idx=stored_rxtx_log_pause_limits.get("pause_max_idx"),
+        # Re-render the log from scratch.
+        is_reset = True
+        from_idx = min_idx
+
+    rxtx_log_update = {
+        "reset": is_reset,
+        "entries": generate_rx_tx_log_entries(
+            min_idx=from_idx,
+            max_idx=max_idx,
+            show_end_of_line_chars=display_options.get("show_end_of_line_chars", False),
+            show_timestamp=display_options.get("show_timestamp", False),
+            auto_format_json=display_options.get("auto_format_json", False),
         ),
-        app_store.uart_log_refresh_rate_ms,  # new refresh interval
-    )
+        "max_entries": MAX_RX_TX_LOG_ENTRIES,
+        # Sent as an age (rather than a timestamp), as the browser's clock may differ.
+        "last_tx_age_sec": time.time() - app_store.last_tx_timestamp_sec,
+    }
+    logger.info(f"Sending log: {from_idx=}, {max_idx=}, {is_reset=}")
+
+    # The state of this client's rendered log. Also passed to the pause button, to freeze the log.
+    rxtx_log_render_state = {
+        "min_idx": min_idx,
+        "max_idx": max_idx,
+        "display_options": display_options,
+        "clear_count": app_store.rxtx_log_clear_count,
+    }
+
+    return rxtx_log_update, rxtx_log_render_state
 
 
 def generate_left_pane(*, selected_command_name: str, enable_advanced: bool) -> list:
@@ -477,14 +621,8 @@ def generate_left_pane(*, selected_command_name: str, enable_advanced: bool) ->
                 dbc.Label("Select a Serial Port:", html_for="uart-port-dropdown"),
                 dcc.Dropdown(
                     id="uart-port-dropdown",
-                    options=(
-                        [
-                            {
-                                "label": UART_PORT_OPTION_LABEL_DISCONNECTED,
-                                "value": UART_PORT_NAME_DISCONNECTED,
-                            }
-                        ]
-                        + [{"label": port, "value": port} for port in list_serial_ports()]
+                    options=list(
+                        _get_uart_port_dropdown_options_cached(_list_serial_ports_cached())
                     ),
                     value=UART_PORT_NAME_DISCONNECTED,
                     className="mb-3",  # Add margin bottom to the dropdown
@@ -502,7 +640,9 @@ def generate_left_pane(*, selected_command_name: str, enable_advanced: bool) ->
                 dbc.Label("Select a Telecommand:", html_for="telecommand-dropdown"),
                 dcc.Dropdown(
                     id="telecommand-dropdown",
-                    options=[{"label": cmd, "value": cmd} for cmd in get_telecommand_name_list()],
+                    options=list(
+                        _get_telecommand_dropdown_options_cached(app_store.firmware_repo_path)
+                    ),
                     value=selected_command_name,
                     className="mb-3",  # Add margin bottom to the dropdown
                     style={"fontFamily": "monospace"},
@@ -510,7 +650,7 @@ def generate_left_pane(*, selected_command_name: str, enable_advanced: bool) ->
             ],
         ),
         html.Div(
-            update_argument_inputs(selected_command_name),
+            list(_build_arg_inputs(selected_command_name)),
             id="argument-inputs-container",
             className="mb-3",
         ),
@@ -612,27 +752,17 @@ def generate_left_pane(*, selected_command_name: str, enable_advanced: bool) ->
     ]
 
 
-def run_dash_app(*, enable_debug: bool = False, enable_advanced: bool = False) -> None:
-    """Run the main Dash application."""
-    app_name = "CTS-SAT-1 Ground Support"
-    app = dash.Dash(
-        __name__,  # required to load /assets folder
-        external_stylesheets=[dbc.themes.BOOTSTRAP],
-        title=app_name,
-        update_title=(
-            # Disable the update title, unless we're debugging.
-            # Makes it look cleaner overall.
-            "Updating..." if enable_debug else ""
-        ),
-    )
+def generate_layout(*, enable_advanced: bool) -> dbc.Container:
+    """Make the layout of the whole GUI."""
+    telecommands = get_telecommand_list_from_repo()
 
-    app.layout = dbc.Container(
+    return dbc.Container(
         [
             dash_split_pane.DashSplitPane(
                 [
                     html.Div(
                         generate_left_pane(
-                            selected_command_name=get_telecommand_name_list()[0],  # default
+                            selected_command_name=telecommands[0].name,  # default
                             enable_advanced=enable_advanced,
                         ),
                         className="p-3",
@@ -642,7 +772,17 @@ def run_dash_app(*, enable_debug: bool = False, enable_advanced: bool = False) -
                         },
                     ),
                     html.Div(
-                        generate_rx_tx_log(),
+                        # Filled in by the browser, as new entries arrive.
+                        html.Div(
+                            [],
+                            id="rx-tx-log",
+                            className="p-3",
+                            style={
+                                "display": "block",
+                                # Make the horizontal scrollbar work correctly.
+                                "width": "fit-content",
+                            },
+                        ),
                         id="rx-tx-log-container",
                         style={
                             "fontFamily": "monospace",
@@ -686,74 +826,39 @@ def run_dash_app(*, enable_debug: bool = False, enable_advanced: bool = False) -
                 n_intervals=0,
             ),
             dcc.Store(id="stored-command-preview", data=""),
-            dcc.Store(id="stored-rxtx-log-pause-limits", data={"paused": False}.copy()),
+            dcc.Store(id="stored-arg-values", data=[]),
+            dcc.Store(
+                id="stored-telecommand-arg-counts",
+                data={tcmd.name: tcmd.number_of_args for tcmd in telecommands},
+            ),
+            dcc.Store(id="stored-rxtx-log-pause-limits", data={"paused": False}),
+            dcc.Store(id="stored-rxtx-log-render-state", data={}),
+            dcc.Store(id="stored-rxtx-log-update", data={}),
+            dcc.Store(id="stored-display-options", data={}),
+            dcc.Store(id="stored-last-tx-timestamp-sec", data=0),
         ],
         fluid=True,  # Use a fluid container for full width.
     )
 
-    start_uart_listener()
 
-    app.run_server(debug=enable_debug)
-    logger.info("Dash app started and finished.")
-
-
-def main() -> None:
-    """Run the main server, with optional debug mode (via CLI arg)."""
-    parser = argparse.ArgumentParser()
-    parser.add_argument(
-        "-r",
-        "--repo",
-        "--firmware-repo",
-        dest="firmware_repo",
-        type=str,
-        help=(
-            "Path to the root of the CTS-SAT-1-OBC-Firmware repository, for reading telecommand "
-            "list. "
-            "If not provided, the repo will automatically be cloned to a temporary directory."
+def run_dash_app(*, enable_debug: bool = False, enable_advanced: bool = False) -> None:
+    """Run the main Dash application."""
+    app_name = "CTS-SAT-1 Ground Support"
+    app = dash.Dash(
+        __name__,  # required to load /assets folder
+        external_stylesheets=[dbc.themes.BOOTSTRAP],
+        title=app_name,
+        update_title=(
+            # Disable the update title, unless we're debugging.
+            # Makes it look cleaner overall.
+            "Updating..." if enable_debug else ""
         ),
     )
-    parser.add_argument(
-        "-d",
-        "--debug",
-        action="store_true",
-        help="Enable debug mode for the Dash app.",
-    )
-    parser.add_argument(
-        "-a",
-        "--advanced",
-        action="store_true",
-        help="Enable advanced features for ground debugging, like the extra suffix tags input.",
-    )
-    args = parser.parse_args()
-
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        if args.firmware_repo is None:
-            firmware_repo_path, repo = clone_firmware_repo(Path(tmp_dir))
-            logger.info(
-                "Cloned CTS-SAT-1-OBC-Firmware repo to temporary directory "
-                f"(commit={repo.head.commit.hexsha[0:7]}): {tmp_dir}"
-            )
-        else:
-            firmware_repo_path = Path(args.firmware_repo)
-
-            if not firmware_repo_path.is_dir():
-                msg = f"Provided CTS-SAT-1-OBC-Firmware repo not found: {args.firmware_repo}"
-                raise FileNotFoundError(msg)
-
-            logger.info(f"Using provided CTS-SAT-1-OBC-Firmware repo: {args.firmware_repo}")
-
-        app_store.firmware_repo_path = firmware_repo_path
-
-        logger.info(
-            f"CTS-SAT-1-OBC-Firmware repo contains {len(get_telecommand_name_list())} "
-            "telecommands."
-        )
 
-        run_dash_app(
-            enable_debug=args.debug,
-            enable_advanced=args.advanced,
-        )
+    # Generate the layout on each page load, so that it reflects the latest telecommand list.
+    app.layout = functools.partial(generate_layout, enable_advanced=enable_advanced)
 
+    start_uart_listener()
 
-if __name__ == "__main__":
-    main()
+    app.run_server(debug=enable_debug)
+    logger.info("Dash app started and finished.")
@@ -0,0 +1,57 @@
+"""Unit tests for the `app_store.py` module."""
+
+import threading
+from collections import deque
+
+from cts1_ground_support.terminal_app.app_store import AppStore
+from cts1_ground_support.terminal_app.app_types import RxTxLogEntry
+
+
+def test_get_rxtx_log_slice() -> None:
+    """Test that `get_rxtx_log_slice` returns the entries within the index range."""
+    store = AppStore()
+    for i in range(5):
+        store.append_to_rxtx_log(RxTxLogEntry(f"msg {i}".encode(), "receive"))
+
+    assert store.rxtx_log_min_idx == 0
+    assert store.rxtx_log_max_idx == 5
+
+    assert [idx for idx, _ in store.get_rxtx_log_slice(2, 4)] == [2, 3, 4]
+    assert [idx for idx, _ in store.get_rxtx_log_slice(-10, 1)] == [0, 1]
+    assert [idx for idx, _ in store.get_rxtx_log_slice(4, 100)] == [4, 5]
+    assert store.get_rxtx_log_slice(100, 200) == []
+
+    store.clear_rxtx_log()
+    assert store.rxtx_log_min_idx == store.rxtx_log_max_idx == 6
+    assert store.get_rxtx_log_slice(0, 5) == []
+    assert [idx for idx, _ in store.get_rxtx_log_slice(0, 6)] == [6]
+
+
+def test_get_rxtx_log_slice_after_dropping_oldest() -> None:
+    """Test `get_rxtx_log_slice` once the oldest entries are dropped by the deque's `maxlen`."""
+    store = AppStore(rxtx_log=deque([(0, RxTxLogEntry(b"Start of Log", "notice"))], maxlen=3))
+    for i in range(5):
+        store.append_to_rxtx_log(RxTxLogEntry(f"msg {i}".encode(), "receive"))
+
+    assert [idx for idx, _ in store.rxtx_log] == [3, 4, 5]
+    assert [idx for idx, _ in store.get_rxtx_log_slice(0, 100)] == [3, 4, 5]
+    assert [idx for idx, _ in store.get_rxtx_log_slice(4, 4)] == [4]
+    assert [idx for idx, _ in store.get_rxtx_log_slice(5, 100)] == [5]
+
+
+def test_append_to_rxtx_log_from_threads() -> None:
+    """Test that appending from several threads at once keeps the log indices consecutive."""
+    store = AppStore()
+
+    def append_many() -> None:
+        for _ in range(1000):
+            store.append_to_rxtx_log(RxTxLogEntry(b"msg", "receive"))
+
+    threads = [threading.Thread(target=append_many) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [idx for idx, _ in store.rxtx_log] == list(range(4001))
+    assert [idx for idx, _ in store.get_rxtx_log_slice(3990, 4000)] == list(range(3990, 4001))
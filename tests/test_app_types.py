@@ -0,0 +1,22 @@
+"""Unit tests for the `app_types.py` module."""
+
+from cts1_ground_support.terminal_app.app_types import RxTxLogEntry
+
+
+def test_rxtx_log_entry_to_string_cached() -> None:
+    """Test that `RxTxLogEntry.to_string` gives the right result for each set of options."""
+    entry = RxTxLogEntry(b'Received {"a": 1}\n', "receive")
+    kwargs = {"show_end_of_line_chars": False, "show_timestamp": False}
+
+    formatted = entry.to_string(**kwargs, auto_format_json=True)
+    assert formatted == entry.to_string(**kwargs, auto_format_json=True)
+    assert formatted != entry.to_string(**kwargs, auto_format_json=False)
+    assert entry.to_string(**kwargs, auto_format_json=False) == entry._render_string(  # noqa: SLF001
+        **kwargs, auto_format_json=False
+    )
+
+
+def test_rxtx_log_entry_css_style_with_margin() -> None:
+    """Test that `RxTxLogEntry.css_style_with_margin` extends `css_style`."""
+    entry = RxTxLogEntry(b"Sent", "transmit")
+    assert entry.css_style_with_margin == {"color": "cyan", "margin": "0", "lineHeight": "1.1"}
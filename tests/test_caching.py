@@ -0,0 +1,35 @@
+"""Unit tests for the `caching.py` module."""
+
+import pytest
+
+from cts1_ground_support import caching
+from cts1_ground_support.caching import ttl_cache
+
+
+def test_ttl_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that `ttl_cache` caches results per args, until they expire or are cleared."""
+    now_sec = 1000.0
+    monkeypatch.setattr(caching.time, "monotonic", lambda: now_sec)
+    calls: list[int] = []
+
+    @ttl_cache(ttl_sec=5)
+    def square(x: int) -> int:
+        calls.append(x)
+        return x * x
+
+    assert square(3) == 9
+    assert square(3) == 9
+    assert square(4) == 16
+    assert calls == [3, 4]
+
+    now_sec += 4.5
+    assert square(3) == 9
+    assert calls == [3, 4]
+
+    now_sec += 0.5
+    assert square(3) == 9
+    assert calls == [3, 4, 3]
+
+    square.cache_clear()
+    assert square(4) == 16
+    assert calls == [3, 4, 3, 4]
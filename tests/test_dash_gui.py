@@ -0,0 +1,31 @@
+"""Unit tests for the `dash_gui.py` module."""
+
+import pytest
+
+from cts1_ground_support.terminal_app.dash_gui import _parse_extra_suffix_tags
+
+
+@pytest.mark.parametrize(
+    ("extra_suffix_tags_input", "expected"),
+    [
+        ("", {}),
+        (None, {}),
+        ('{"sha256": "abc", "tsexec": "123"}', {"sha256": "abc", "tsexec": "123"}),
+        ('{"a10": "abc", "01": "def"}', {"a10": "abc", "01": "def"}),
+        ("not json", {}),
+        ('["a", "b"]', {}),
+        ('{"x": 5}', {"x": 5}),
+        ('{"x": -9007199254740991}', {"x": -9007199254740991}),
+        ('{"x": 9007199254740992}', {}),
+        ('{"flag": true}', {}),
+        ('{"value": 1.0}', {}),
+        ('{"value": null}', {}),
+        ('{"10": "abc"}', {}),
+        ('{"0": "abc"}', {}),
+    ],
+)
+def test_parse_extra_suffix_tags(
+    extra_suffix_tags_input: str | None, expected: dict[str, str]
+) -> None:
+    """Test that only objects of string/integer values, without integer-like keys, are accepted."""
+    assert _parse_extra_suffix_tags(extra_suffix_tags_input) == expected
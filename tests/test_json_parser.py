@@ -0,0 +1,71 @@
+"""Unit tests for the `json_parser.py` module."""
+
+import pytest
+
+from cts1_ground_support import json_parser
+from cts1_ground_support.json_parser import auto_format_json_in_blob, extract_json_blobs
+
+
+def test_extract_json_blobs() -> None:
+    """Test the `extract_json_blobs` function."""
+    in1 = 'Start {"a": 1} middle {"b": [1, {"c": "}"}]} end'
+    parsed1 = list(extract_json_blobs(in1))
+    assert [p.data for p in parsed1] == [{"a": 1}, {"b": [1, {"c": "}"}]}]
+    assert [p.original_str for p in parsed1] == ['{"a": 1}', '{"b": [1, {"c": "}"}]}']
+    for p in parsed1:
+        assert in1[p.start_idx : p.end_idx] == p.original_str
+
+    # Adjacent objects.
+    assert [p.data for p in extract_json_blobs('{"a":1}{"b":2}')] == [{"a": 1}, {"b": 2}]
+
+    # Escaped quotes inside strings.
+    assert [p.data for p in extract_json_blobs(r'x {"a": "q\"}"} y')] == [{"a": 'q"}'}]
+
+    # Valid objects nested inside invalid or unterminated spans are still found.
+    assert [p.data for p in extract_json_blobs('{ foo {"a": 1} }')] == [{"a": 1}]
+    assert [p.data for p in extract_json_blobs('{ unclosed {"a": 1} tail')] == [{"a": 1}]
+
+    # Braces which can't start a JSON object are skipped.
+    assert [p.data for p in extract_json_blobs('{foo} {bar {"a": {}}')] == [{"a": {}}]
+
+    # Empty object.
+    assert [p.data for p in extract_json_blobs("x {} y")] == [{}]
+
+    # No JSON at all.
+    assert list(extract_json_blobs("")) == []
+    assert list(extract_json_blobs("No JSON [0xDA] here.")) == []
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        '{"a' * 2000,  # Unterminated, with every other `{` inside a string.
+        '{"a": 1, ' * 2000,  # Unterminated, with deeply nested objects.
+        "{" * 2000,
+    ],
+)
+def test_extract_json_blobs_unterminated_is_linear(
+    content: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that unterminated spans aren't re-scanned from each of their nested braces."""
+    scan_count = 0
+    find_json_object_ends = json_parser._find_json_object_ends  # noqa: SLF001
+
+    def counting_find_json_object_ends(content: str, start_idx: int) -> dict[int, int | None]:
+        nonlocal scan_count
+        scan_count += 1
+        return find_json_object_ends(content, start_idx)
+
+    monkeypatch.setattr(json_parser, "_find_json_object_ends", counting_find_json_object_ends)
+
+    assert list(extract_json_blobs(content)) == []
+    assert scan_count <= 2
+
+
+def test_auto_format_json_in_blob() -> None:
+    """Test the `auto_format_json_in_blob` function."""
+    assert auto_format_json_in_blob('Data: {"a":1} done') == 'Data: {\n  "a": 1\n} done'
+    assert auto_format_json_in_blob("No JSON here.") == "No JSON here."
+
+    # Identical objects are each formatted exactly once, in place.
+    assert auto_format_json_in_blob('{"a":1} {"a":1}') == '{\n  "a": 1\n} {\n  "a": 1\n}'
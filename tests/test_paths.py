@@ -20,3 +20,23 @@ def test_read_text_file(test_str: str) -> None:
 
         read_back = read_text_file(f)
     assert read_back == test_str
+
+
+def test_read_text_file_after_modification() -> None:
+    """Test that the `read_text_file` function returns the new contents of a modified file."""
+    with tempfile.TemporaryDirectory() as dir_path:
+        f = Path(dir_path) / "test.txt"
+        f.write_text("Original contents", encoding="utf-8")
+        assert read_text_file(f) == "Original contents"
+        assert read_text_file(str(f)) == "Original contents"
+
+        f.write_text("Modified contents, which are longer", encoding="utf-8")
+        assert read_text_file(f) == "Modified contents, which are longer"
+
+
+def test_read_text_file_newlines() -> None:
+    """Test that the `read_text_file` function normalizes newlines, like text mode does."""
+    with tempfile.TemporaryDirectory() as dir_path:
+        f = Path(dir_path) / "test.txt"
+        f.write_bytes(b"Windows\r\nOld Mac\rUnix\n")
+        assert read_text_file(f) == "Windows\nOld Mac\nUnix\n"
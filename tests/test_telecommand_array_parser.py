@@ -7,6 +7,7 @@ import pytest
 
 from cts1_ground_support.paths import clone_firmware_repo
 from cts1_ground_support.telecommand_array_parser import (
+    extract_all_c_function_docstrings,
     extract_c_function_docstring,
     extract_telecommand_arg_list,
     parse_telecommand_array_table,
@@ -24,6 +25,10 @@ def test_remove_c_comments() -> None:
     in2 = """int var = 5; /* This is a comment */ int var2 = 6;"""
     assert remove_c_comments(in2) == "int var = 5;\nint var2 = 6;"
 
+    # A `/*` inside a line comment doesn't start a block comment.
+    in3 = """int var = 5; // Comment with /* in it\nint var2 = 6; /* Comment */"""
+    assert remove_c_comments(in3) == "int var = 5;\nint var2 = 6;\n"
+
 
 def test_parse_telecommand_list() -> None:
     """Test the `parse_telecommand_array_table` function."""
@@ -60,6 +65,16 @@ def test_parse_telecommand_list() -> None:
     parsed1 = parse_telecommand_array_table(in1)
     assert parsed1 == expected1
 
+    # Commas and braces inside string literals don't end the field or struct.
+    in2 = """
+    const TCMD_TelecommandDefinition_t TCMD_telecommand_definitions[] = {
+        {.tcmd_name = "odd,name{}", .tcmd_func = TCMDEXEC_odd, .number_of_args = 0,
+         .readiness_level = TCMD_READINESS_LEVEL_FOR_OPERATION}
+    };
+    """
+    parsed2 = parse_telecommand_array_table(in2)
+    assert [tcmd.name for tcmd in parsed2] == ["odd,name{}"]
+
     with pytest.raises(ValueError, match="Expected to find exactly 1 telecommand array"):
         parse_telecommand_array_table("")
 
@@ -141,6 +156,43 @@ uint8_t TCMDEXEC_flash_erase(const char *args_str, TCMD_TelecommandChannel_enum_
     assert result_flash_erase == expected_docstring_flash_erase
 
 
+def test_extract_all_c_function_docstrings() -> None:
+    """Test the `extract_all_c_function_docstrings` function."""
+    c_code = """
+    /// @brief This is a docstring for the `hello_world` function.
+    /// @return This function returns 0.
+    int hello_world(int arg1) {
+        return 0;
+    }
+
+    int no_docstring_function(int arg) {
+        return 1;
+    }
+
+    /// @brief This is a docstring for another function.
+    uint8_t another_function(int arg) {
+        return 1;
+    }
+    """
+    result = extract_all_c_function_docstrings(c_code)
+    assert result == {
+        "hello_world": (
+            "@brief This is a docstring for the `hello_world` function.\n"
+            "@return This function returns 0."
+        ),
+        "another_function": "@brief This is a docstring for another function.",
+    }
+
+    # Must agree with the single-function version.
+    for function_name, docstring in result.items():
+        assert extract_c_function_docstring(function_name, c_code) == docstring
+
+    # UTF-8 bytes input gives the same result.
+    assert extract_all_c_function_docstrings(c_code.encode("utf-8")) == result
+
+    assert extract_all_c_function_docstrings("") == {}
+
+
 def test_extract_telecommand_arg_list() -> None:
     """Test the `extract_telecommand_arg_list` function."""
     input1 = """
@@ -191,12 +243,76 @@ def test_extract_telecommand_arg_list() -> None:
     result4 = extract_telecommand_arg_list(input4)
     assert result4 == exp_output4
 
+    # Only the contiguous argument lines directly after `@param args_str` are arguments.
+    input5 = "@param args_str\n- Arg 0: a\n\n@details\n- Arg 1: x"
+    assert extract_telecommand_arg_list(input5) == ["a"]
+
+    input6 = "@param args_str No args.\n@return 0\n@note - Arg 0: removed"
+    assert extract_telecommand_arg_list(input6) == []
+
+    input7 = "@param args_str - Arg 0: inline\n- Arg 1: b"
+    assert extract_telecommand_arg_list(input7) == ["b"]
+
+    # Comment characters before the argument lines are skipped.
+    input8 = "/// @param args_str\n/// - Arg 0: a\n/// - Arg 1: b\n/// @return 0"
+    assert extract_telecommand_arg_list(input8) == ["a", "b"]
+
+    # Nothing after the `@param args_str` line, so return None
+    assert extract_telecommand_arg_list("@brief Hello.\n@param args_str") is None
+
+
+def test_parse_telecommand_list_from_repo_local() -> None:
+    """Test the `parse_telecommand_list_from_repo` function with a tiny local repo layout."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        repo_path = Path(tmp_dir)
+        tcmd_dir = repo_path / "firmware/Core/Src/telecommands"
+        tcmd_dir.mkdir(parents=True)
+        (tcmd_dir / "telecommand_definitions.c").write_text("""
+const TCMD_TelecommandDefinition_t TCMD_telecommand_definitions[] = {
+    {
+        .tcmd_name = "hello_world",
+        .tcmd_func = TCMDEXEC_hello_world,
+        .number_of_args = 0,
+        .readiness_level = TCMD_READINESS_LEVEL_FOR_OPERATION,
+    },
+    {
+        .tcmd_name = "fs_write_file",
+        .tcmd_func = TCMDEXEC_fs_write_file,
+        .number_of_args = 2,
+        .readiness_level = TCMD_READINESS_LEVEL_FOR_OPERATION,
+    },
+};
+""")
+        (tcmd_dir / "lfs_telecommand_defs.c").write_text("""
+/// @brief Telecommand: Write data to a file in LittleFS
+/// @param args_str
+/// - Arg 0: File path as string
+/// - Arg 1: String to write to file
+uint8_t TCMDEXEC_fs_write_file(const char *args_str) {
+    return 0;
+}
+""")
+        telecommands = parse_telecommand_list_from_repo(repo_path)
+
+    assert [tcmd.name for tcmd in telecommands] == ["hello_world", "fs_write_file"]
+
+    # No docstring in the repo for hello_world.
+    assert telecommands[0].full_docstring is None
+    assert telecommands[0].argument_descriptions is None
+
+    assert telecommands[1].full_docstring is not None
+    assert telecommands[1].full_docstring.startswith("@brief ")
+    assert telecommands[1].argument_descriptions == [
+        "File path as string",
+        "String to write to file",
+    ]
+
 
 def test_parse_telecommand_list_from_repo() -> None:
     """Test the `parse_telecommand_list_from_repo` function with the real file in this repo."""
     # TODO: Consider adding a local tiny copy of the relevant files from the repo instead.
     with tempfile.TemporaryDirectory() as tmp_dir:
-        repo_path, _repo = clone_firmware_repo(Path(tmp_dir))
+        repo_path = clone_firmware_repo(Path(tmp_dir))
         telecommands = parse_telecommand_list_from_repo(repo_path)
 
     assert isinstance(telecommands, list)